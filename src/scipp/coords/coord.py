@@ -7,7 +7,7 @@ import dataclasses
 from ..core import Variable
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Coord:
     dense: Variable | None  # for dense variable or bin-coord
     event: Variable | None
@@ -60,8 +60,8 @@ def _apply_keep_options(
     usages: dict[str, int], rules: list[Rule], targets: set[str], options: Options
 ) -> dict[str, int]:
     def out_names(rule_type):
-        yield from filter(
-            lambda name: name not in targets, rule_output_names(rules, rule_type)
+        yield from (
+            name for name in rule_output_names(rules, rule_type) if name not in targets
         )
 
     def handle_in(names):
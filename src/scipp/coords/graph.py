@@ -5,10 +5,10 @@
 from __future__ import annotations
 
 import collections
-from collections.abc import Iterable
-from graphlib import TopologicalSorter
+from collections.abc import Iterable, Iterator
+from graphlib import CycleError
 
-from ..core import DataArray
+from ..core import DataArray, Dataset
 from ..utils.graph import make_graphviz_digraph
 from .rule import ComputeRule, FetchRule, Kernel, RenameRule, Rule
 
@@ -25,6 +25,8 @@ class Graph:
             self._rules: dict[str, Rule] = graph
         else:
             self._rules: dict[str, Rule] = _convert_to_rule_graph(graph)
+        # Reverse dependencies, built on first use by children_of.
+        self._children: dict[str, list[str]] | None = None
 
     def __getitem__(self, name: str) -> Rule:
         return self._rules[name]
@@ -41,22 +43,23 @@ class Graph:
             return
 
     def children_of(self, node: str) -> Iterable[str]:
-        for candidate, rule in self.items():
-            if node in rule.dependencies:
-                yield candidate
+        yield from self._children_index().get(node, ())
 
     def nodes(self) -> Iterable[str]:
         yield from self._rules.keys()
 
     def nodes_topologically(self) -> Iterable[str]:
-        yield from TopologicalSorter(
-            {out: rule.dependencies for out, rule in self._rules.items()}
-        ).static_order()
+        yield from _sort_topologically(self._rules, self._children_index())
 
-    def graph_for(self, da: DataArray, targets: set[str]) -> Graph:
+    def _children_index(self) -> dict[str, list[str]]:
+        if self._children is None:
+            self._children = _make_children_index(self._rules)
+        return self._children
+
+    def graph_for(self, da: DataArray | Dataset, targets: set[str]) -> Graph:
         """
         Construct a graph containing only rules needed for the given DataArray
-        and targets, including FetchRules for the inputs.
+        or Dataset and targets, including FetchRules for the inputs.
         """
         subgraph = {}
         depth_first_stack = list(targets)
@@ -67,12 +70,14 @@ class Graph:
             rule = self._rule_for(out_name, da)
             for name in rule.out_names:
                 subgraph[name] = rule
-            depth_first_stack.extend(rule.dependencies)
+            depth_first_stack.extend(
+                dep for dep in rule.dependencies if dep not in subgraph
+            )
         return Graph(subgraph)
 
-    def _rule_for(self, out_name: str, da: DataArray) -> Rule:
+    def _rule_for(self, out_name: str, da: DataArray | Dataset) -> Rule:
         if _is_in_coords(out_name, da):
-            return FetchRule((out_name,), da.coords, da.bins.coords if da.bins else {})
+            return _fetch_rule((out_name,), da)
         try:
             return self._rules[out_name]
         except KeyError:
@@ -110,14 +115,24 @@ class Graph:
 
 
 def rule_sequence(rules: Graph) -> list[Rule]:
-    already_used = set()
-    result = []
-    for rule in (
-        r for n in rules.nodes_topologically() if (r := rules[n]) not in already_used
-    ):
-        already_used.add(rule)
-        result.append(rule)
-    return result
+    # Rules with multiple outputs appear once per output, keep only the first.
+    return list(dict.fromkeys(rules[n] for n in rules.nodes_topologically()))
+
+
+def rebind_fetch_rules(rules: list[Rule], da: DataArray) -> list[Rule]:
+    """Return rules where all FetchRules get their inputs from ``da``.
+
+    ``da`` must have coords and bin-coords with the same names as the data array
+    that the rules were originally constructed for.
+    """
+    return [
+        _fetch_rule(rule.out_names, da) if isinstance(rule, FetchRule) else rule
+        for rule in rules
+    ]
+
+
+def _fetch_rule(out_names: tuple[str, ...], da: DataArray | Dataset) -> FetchRule:
+    return FetchRule(out_names, da.coords, da.bins.coords if da.bins else {})
 
 
 def _make_rule(products, producer) -> Rule:
@@ -140,5 +155,75 @@ def _convert_to_rule_graph(graph: GraphDict) -> dict[str, Rule]:
     return rule_graph
 
 
-def _is_in_coords(name: str, da: DataArray) -> bool:
+def _make_children_index(rules: dict[str, Rule]) -> dict[str, list[str]]:
+    children: dict[str, list[str]] = {}
+    for out_name, rule in rules.items():
+        for dep in rule.dependencies:
+            children.setdefault(dep, []).append(out_name)
+    return children
+
+
+def _sort_topologically(
+    rules: dict[str, Rule], children: dict[str, list[str]]
+) -> list[str]:
+    """Return all nodes in topological order using Kahn's algorithm.
+
+    The order and the ``CycleError`` raised for cyclic graphs are the same as
+    those of ``graphlib.TopologicalSorter.static_order``.
+    """
+    in_degree = {}
+    for out_name, rule in rules.items():
+        in_degree[out_name] = len(rule.dependencies)
+        for dep in rule.dependencies:
+            in_degree.setdefault(dep, 0)
+    ready = collections.deque(node for node, n in in_degree.items() if n == 0)
+    order = []
+    while ready:
+        node = ready.popleft()
+        order.append(node)
+        for child in children.get(node, ()):
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                ready.append(child)
+    if len(order) != len(in_degree):
+        raise CycleError('nodes are in a cycle', _find_cycle(in_degree, children))
+    return order
+
+
+def _find_cycle(
+    nodes: Iterable[str], children: dict[str, list[str]]
+) -> list[str] | None:
+    """Return the path of the first cycle found by a depth-first search.
+
+    The path starts and ends with the same node, as in ``graphlib``.
+    """
+    stack: list[str] = []
+    child_iters: list[Iterator[str]] = []
+    seen: set[str] = set()
+    stack_index: dict[str, int] = {}
+    for node in nodes:
+        if node in seen:
+            continue
+        while True:
+            if node in seen:
+                if node in stack_index:
+                    return stack[stack_index[node] :] + [node]
+            else:
+                seen.add(node)
+                child_iters.append(iter(children.get(node, ())))
+                stack_index[node] = len(stack)
+                stack.append(node)
+            while stack:
+                child: str | None = next(child_iters[-1], None)
+                if child is not None:
+                    node = child
+                    break
+                del stack_index[stack.pop()]
+                child_iters.pop()
+            else:
+                break
+    return None
+
+
+def _is_in_coords(name: str, da: DataArray | Dataset) -> bool:
     return name in da.coords or (da.bins is not None and name in da.bins.coords)
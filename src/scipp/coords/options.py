@@ -5,7 +5,7 @@
 import dataclasses
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Options:
     """
     Optional arguments of transform_coords.
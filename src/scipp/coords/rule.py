@@ -9,6 +9,7 @@ They provide a common interface for renaming and computing new coordinates.
 from __future__ import annotations
 
 import inspect
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Mapping
 from copy import copy
@@ -37,6 +38,8 @@ Kernel = Callable[..., Variable]
 
 
 class Rule(ABC):
+    __slots__ = ('out_names',)
+
     def __init__(self, out_names: tuple[str, ...]):
         self.out_names = out_names
 
@@ -60,6 +63,8 @@ class FetchRule(Rule):
     Can be used to abstract away retrieving coords from the input DataArray.
     """
 
+    __slots__ = ('_dense_sources', '_event_sources')
+
     def __init__(
         self,
         out_names: tuple[str, ...],
@@ -93,6 +98,8 @@ class RenameRule(Rule):
     Return the input coordinate and give it a new name.
     """
 
+    __slots__ = ('_in_name',)
+
     def __init__(self, out_names: tuple[str, ...], in_name: str):
         super().__init__(out_names)
         self._in_name = in_name
@@ -117,10 +124,13 @@ class ComputeRule(Rule):
     Compute new coordinates using the provided callable.
     """
 
+    __slots__ = ('_arg_names', '_dependencies', '_func')
+
     def __init__(self, out_names: tuple[str, ...], func: Kernel):
         super().__init__(out_names)
         self._func = func
         self._arg_names = _arg_names(func)
+        self._dependencies = tuple(self._arg_names)
 
     def __call__(self, coords: _CoordProvider) -> dict[str, Coord]:
         inputs = {
@@ -186,7 +196,7 @@ class ComputeRule(Rule):
 
     @property
     def dependencies(self) -> tuple[str, ...]:
-        return tuple(self._arg_names)
+        return self._dependencies
 
     @property
     def func_name(self) -> str:
@@ -202,16 +212,39 @@ class ComputeRule(Rule):
         )
 
 
-def rules_of_type(rules: list[Rule], rule_type: type) -> Iterable[Rule]:
-    yield from filter(lambda rule: isinstance(rule, rule_type), rules)
+def rules_of_type(
+    rules: list[Rule], rule_type: type | tuple[type, ...]
+) -> Iterable[Rule]:
+    yield from (rule for rule in rules if isinstance(rule, rule_type))
 
 
-def rule_output_names(rules: list[Rule], rule_type: type) -> Iterable[str]:
+def rule_output_names(
+    rules: list[Rule], rule_type: type | tuple[type, ...]
+) -> Iterable[str]:
     for rule in rules_of_type(rules, rule_type):
         yield from rule.out_names
 
 
+# Argument names of kernels, computed from their signature.
+# Weakly keyed to not keep kernels such as large lookup tables alive.
+_signature_arg_names: weakref.WeakKeyDictionary[Kernel, tuple[str, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def _arg_names(func) -> dict[str, str]:
+    try:
+        names = _signature_arg_names[func]
+    except KeyError:
+        names = _signature_arg_names[func] = _inspect_arg_names(func)
+    except TypeError:
+        # func is not hashable or does not support weak references.
+        names = _inspect_arg_names(func)
+    coords = getattr(func, '__transform_coords_input_keys__', names)
+    return dict(zip(coords, names, strict=True))
+
+
+def _inspect_arg_names(func) -> tuple[str, ...]:
     spec = inspect.getfullargspec(func)
     if spec.varargs is not None or spec.varkw is not None:
         raise ValueError(
@@ -224,6 +257,4 @@ def _arg_names(func) -> dict[str, str]:
         # Strip off the 'self'. Objects returned by functools.partial are not
         # functions, but nevertheless do not have 'self'.
         args = spec.args[1:]
-    names = tuple(args + spec.kwonlyargs)
-    coords = getattr(func, '__transform_coords_input_keys__', names)
-    return dict(zip(coords, names, strict=True))
+    return tuple(args + spec.kwonlyargs)
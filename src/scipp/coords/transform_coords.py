@@ -1,17 +1,28 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 # @author Simon Heybrock, Jan-Lukas Wynen
+import logging
+import math
 from collections.abc import Iterable, Mapping
 from dataclasses import fields
-from fractions import Fraction
-
-from ..core import DataArray, Dataset, DimensionError, VariableError, bins, empty
+from typing import TypeVar
+
+from ..core import (
+    Bins,
+    DataArray,
+    Dataset,
+    DimensionError,
+    VariableError,
+    bins,
+)
 from ..logging import get_logger
 from .coord_table import Coord, CoordTable
-from .graph import Graph, GraphDict, rule_sequence
+from .graph import Graph, GraphDict, rebind_fetch_rules, rule_sequence
 from .options import Options
 from .rule import ComputeRule, FetchRule, Kernel, RenameRule, Rule, rule_output_names
 
+_Data = TypeVar('_Data', DataArray, Dataset)
+
 
 def transform_coords(
     x: DataArray | Dataset,
@@ -182,7 +193,17 @@ def _transform_data_array(
     original: DataArray, targets: set[str], graph: Graph, options: Options
 ) -> DataArray:
     graph = graph.graph_for(original, targets)
-    rules = rule_sequence(graph)
+    return _apply_rules(original, targets, graph, rule_sequence(graph), options)
+
+
+def _apply_rules(
+    original: _Data,
+    targets: set[str],
+    graph: Graph,
+    rules: list[Rule],
+    options: Options,
+    dim_name_cache: dict[frozenset[str], dict[str, str]] | None = None,
+) -> _Data:
     working_coords = CoordTable(rules, targets, options)
     dim_coords = set()
     for rule in rules:
@@ -194,9 +215,15 @@ def _transform_data_array(
             if name in original.dims and coord.has_dim(name):
                 dim_coords.add(name)
 
-    dim_name_changes = (
-        _dim_name_changes(graph, dim_coords) if options.rename_dims else {}
-    )
+    if not options.rename_dims:
+        dim_name_changes = {}
+    elif dim_name_cache is None:
+        dim_name_changes = _dim_name_changes(graph, dim_coords)
+    else:
+        key = frozenset(dim_coords)
+        if key not in dim_name_cache:
+            dim_name_cache[key] = _dim_name_changes(graph, dim_coords)
+        dim_name_changes = dim_name_cache[key]
     if not options.quiet:
         _log_transform(rules, targets, dim_name_changes, working_coords)
     res = _store_results(original, working_coords, targets)
@@ -206,24 +233,46 @@ def _transform_data_array(
 def _transform_dataset(
     original: Dataset, targets: set[str], graph: Graph, *, options: Options
 ) -> Dataset:
-    # Note the inefficiency here in datasets with multiple items: Coord transform is
-    # repeated for every item rather than sharing what is possible. Since we may have
-    # dataset items with binned data this is far from trivial. Unless we have clear
+    # Dense items share all coords with the dataset, see #3199. So if there are no
+    # binned items, we can transform the coords of the dataset once for all items.
+    if original.bins is None:
+        graph = graph.graph_for(original, targets)
+        return _apply_rules(original, targets, graph, rule_sequence(graph), options)
+    # Note the inefficiency here in datasets with binned items: Coord transform is
+    # repeated for every item rather than sharing what is possible. Since items
+    # can have different event coords this is far from trivial. Unless we have clear
     # performance requirements, we go with the safe and simple solution.
-    if len(original) > 0:
-        return Dataset(
-            data={
-                name: _transform_data_array(
-                    original[name], targets=targets, graph=graph, options=options
-                )
-                for name in original
-            }
+    # The rules only depend on the names of the available coords, so they are
+    # shared between items with the same coords and bin-coords.
+    plans: dict[
+        tuple[frozenset[str], frozenset[str] | None],
+        tuple[Graph, list[Rule], dict[frozenset[str], dict[str, str]]],
+    ] = {}
+    transformed: dict[str, DataArray] = {}
+    for name in original:
+        item = original[name]
+        key = _input_names(item)
+        if key in plans:
+            subgraph, rules, dim_name_cache = plans[key]
+            rules = rebind_fetch_rules(rules, item)
+        else:
+            subgraph = graph.graph_for(item, targets)
+            rules = rule_sequence(subgraph)
+            dim_name_cache = {}
+            plans[key] = subgraph, rules, dim_name_cache
+        # `subgraph` may fetch from a different item,
+        # but _apply_rules only uses it for its structure.
+        transformed[name] = _apply_rules(
+            item, targets, subgraph, rules, options, dim_name_cache
         )
-    dummy = DataArray(empty(sizes=original.sizes), coords=original.coords)
-    transformed = _transform_data_array(
-        dummy, targets=targets, graph=graph, options=options
+    return Dataset(data=transformed)
+
+
+def _input_names(da: DataArray) -> tuple[frozenset[str], frozenset[str] | None]:
+    return (
+        frozenset(da.coords),
+        frozenset(da.bins.coords) if da.bins is not None else None,
     )
-    return Dataset(coords=transformed.coords)
 
 
 def _log_transform(
@@ -232,47 +281,49 @@ def _log_transform(
     dim_name_changes: Mapping[str, str],
     coords: CoordTable,
 ) -> None:
+    logger = get_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     inputs = set(rule_output_names(rules, FetchRule))
     byproducts = {
         name
-        for name in (
-            set(rule_output_names(rules, RenameRule))
-            | set(rule_output_names(rules, ComputeRule))
-        )
-        - targets
+        for name in set(rule_output_names(rules, (RenameRule, ComputeRule))) - targets
         if coords.total_usages(name) < 0
     }
     preexisting = {target for target in targets if target in inputs}
     steps = [rule for rule in rules if not isinstance(rule, FetchRule)]
 
-    message = (
+    lines = [
         f'Transformed coords ({", ".join(sorted(inputs))}) '
         f'-> ({", ".join(sorted(targets))})'
-    )
+    ]
     if byproducts:
-        message += f'\n  Byproducts:\n    {", ".join(sorted(byproducts))}'
+        lines += ['  Byproducts:', f'    {", ".join(sorted(byproducts))}']
     if dim_name_changes:
-        dim_rename_steps = '\n'.join(
-            f'    {t} <- {f}' for f, t in dim_name_changes.items()
-        )
-        message += '\n  Renamed dimensions:\n' + dim_rename_steps
+        lines.append('  Renamed dimensions:')
+        lines.extend(f'    {t} <- {f}' for f, t in dim_name_changes.items())
     if preexisting:
-        message += (
-            '\n  Outputs already present in input:'
-            f'\n    {", ".join(sorted(preexisting))}'
-        )
-    message += '\n  Steps:\n' + (
-        '\n'.join(f'    {rule}' for rule in steps) if steps else '    None'
-    )
+        lines += [
+            '  Outputs already present in input:',
+            f'    {", ".join(sorted(preexisting))}',
+        ]
+    lines.append('  Steps:')
+    lines.extend(f'    {rule}' for rule in steps)
+    if not steps:
+        lines.append('    None')
+    message = '\n'.join(lines)
 
-    get_logger().info(message)
+    logger.info(message)
 
 
-def _store_coord(da: DataArray, name: str, coord: Coord) -> None:
+def _store_coord(
+    da: DataArray | Dataset, da_bins: Bins[DataArray] | None, name: str, coord: Coord
+) -> None:
     def try_del():
         da.coords.pop(name, None)
-        if da.bins is not None:
-            da.bins.coords.pop(name, None)
+        if da_bins is not None:
+            da_bins.coords.pop(name, None)
 
     def store(x, c):
         x.coords[name] = c
@@ -285,59 +336,73 @@ def _store_coord(da: DataArray, name: str, coord: Coord) -> None:
             store(da, coord.dense)
         if coord.has_event:
             try:
-                store(da.bins, coord.event)
+                store(da_bins, coord.event)
             except (DimensionError, VariableError):
                 # Thrown on mismatching bin indices, e.g. slice
+                if not isinstance(da, DataArray):
+                    raise
                 da.data = da.data.copy()
-                store(da.bins, coord.event)
+                store(da_bins, coord.event)
 
 
-def _store_results(da: DataArray, coords: CoordTable, targets: set[str]) -> DataArray:
+def _store_results(da: _Data, coords: CoordTable, targets: set[str]) -> _Data:
     da = da.copy(deep=False)
-    # See #2773 for why this is necessary.
-    if da.bins is not None:
-        da.data = bins(**da.bins.constituents)
+    # Datasets are only transformed as a whole if none of their items are binned.
+    da_bins: Bins[DataArray] | None = None
+    if isinstance(da, DataArray):
+        # The proxy refers to `da`, not its data, so it remains valid when
+        # the data is replaced below or in _store_coord.
+        da_bins = da.bins
+        # See #2773 for why this is necessary.
+        if da_bins is not None:
+            da.data = bins(**da_bins.constituents)
     for name, coord in coords.items():
         if name in targets:
             coord.aligned = True
-        _store_coord(da, name, coord)
+        _store_coord(da, da_bins, name, coord)
     return da
 
 
-def _color_dims(graph: Graph, dim_coords: set[str]) -> dict[str, dict[str, Fraction]]:
-    colors = {
-        coord: {dim: Fraction(0, 1) for dim in dim_coords} for coord in graph.nodes()
-    }
+def _color_dims(
+    nodes: list[str], children: dict[str, tuple[str, ...]], dim_coords: set[str]
+) -> tuple[dict[str, dict[str, int]], int]:
+    # Colors are integer multiples of 1/full_color. Since a node occurs at most once
+    # on any path, full_color is divisible by the product of the numbers of
+    # children along every path. So all divisions below are exact.
+    full_color = math.prod(len(children[node]) or 1 for node in nodes)
+    colors = {coord: {dim: 0 for dim in dim_coords} for coord in nodes}
     for dim in dim_coords:
-        colors[dim][dim] = Fraction(1, 1)
-        depth_first_stack = [dim]
-        while depth_first_stack:
-            coord = depth_first_stack.pop()
-            children = tuple(graph.children_of(coord))
-            for child in children:
-                # test for produced dim coords
-                if child not in dim_coords:
-                    colors[child][dim] += colors[coord][dim] * Fraction(
-                        1, len(children)
-                    )
-            depth_first_stack.extend(children)
-
-    return colors
-
-
-def _has_full_color_of_dim(colors: dict[str, Fraction], dim: str) -> bool:
+        colors[dim][dim] = full_color
+        # Parents are visited before their children, so every node passes on
+        # its complete color exactly once.
+        for coord in nodes:
+            if color := colors[coord][dim]:
+                for child in children[coord]:
+                    # test for produced dim coords
+                    if child not in dim_coords:
+                        colors[child][dim] += color // len(children[coord])
+
+    return colors, full_color
+
+
+def _has_full_color_of_dim(colors: dict[str, int], dim: str, full_color: int) -> bool:
     return all(
-        fraction == 1 if d == dim else fraction != 1 for d, fraction in colors.items()
+        color == full_color if d == dim else color != full_color
+        for d, color in colors.items()
     )
 
 
 def _dim_name_changes(rule_graph: Graph, dim_coords: set[str]) -> dict[str, str]:
-    colors = _color_dims(rule_graph, dim_coords)
-    nodes = list(rule_graph.nodes_topologically())[::-1]
+    nodes = list(rule_graph.nodes_topologically())
+    children = {node: tuple(rule_graph.children_of(node)) for node in nodes}
+    colors, full_color = _color_dims(nodes, children, dim_coords)
     name_changes = {}
-    for dim in dim_coords:
-        for node in nodes:
-            if _has_full_color_of_dim(colors[node], dim):
+    remaining = set(dim_coords)
+    for node in reversed(nodes):
+        if not remaining:
+            break
+        for dim in tuple(remaining):
+            if _has_full_color_of_dim(colors[node], dim, full_color):
                 name_changes[dim] = node
-                break
+                remaining.discard(dim)
     return name_changes
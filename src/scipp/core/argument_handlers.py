@@ -11,13 +11,18 @@ _ValueType = TypeVar('_ValueType', str, Variable)
 def combine_dict_args(
     arg: dict[str, _ValueType] | None, kwargs: dict[str, _ValueType]
 ) -> dict[str, _ValueType]:
-    pos_dict = {} if arg is None else arg
+    # Common cases: Only one of the two is given. `kwargs` is always a fresh dict,
+    # but `arg` is owned by the caller and may be any mapping, so copy it.
+    if arg is None:
+        return kwargs
+    if not kwargs:
+        return dict(arg)
 
-    overlapped = set(pos_dict).intersection(kwargs)
+    overlapped = set(arg).intersection(kwargs)
     if overlapped:
         raise ValueError(
             'The names passed in the dict and as keyword arguments must be distinct. '
             f'Following names are used in both arguments: {overlapped}'
         )
 
-    return {**pos_dict, **kwargs}
+    return {**arg, **kwargs}
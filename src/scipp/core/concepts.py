@@ -34,11 +34,12 @@ def rewrap_output_data(prototype: _VarOrDa, data: Variable) -> _VarOrDa:
 
 
 def rewrap_reduced_data(prototype: DataArray, data: Variable, dim: Dims) -> DataArray:
+    dims = concrete_dims(prototype, dim)
     return DataArray(
         data,
-        coords=reduced_coords(prototype, dim),
-        masks=reduced_masks(prototype, dim),
-        attrs=reduced_attrs(prototype, dim),
+        coords=_reduced(prototype.coords, dims),
+        masks=_copied(_reduced(prototype.masks, dims)),
+        attrs=_reduced(prototype.deprecated_attrs, dims),
     )
 
 
@@ -86,6 +87,8 @@ def irreducible_mask(da: DataArray, dim: Dims) -> None | Variable:
     Irreducible means that a reduction operation must apply these masks since they
     depend on the reduction dimensions. Returns None if there is no irreducible mask.
     """
+    if len(da.masks) == 0:
+        return None
     dims = set(concrete_dims(da, dim))
     irreducible = [mask for mask in da.masks.values() if not dims.isdisjoint(mask.dims)]
     if len(irreducible) == 0:
@@ -24,4 +24,6 @@ def irreducible_mask(masks: _cpp.Masks, dim: str) -> _cpp.Variable | None:
     :
         Union of irreducible masks or ``None`` if there is no irreducible mask.
     """
+    if len(masks) == 0:
+        return None
     return _call_cpp_func(_cpp.irreducible_mask, masks, dim)
@@ -113,21 +113,27 @@ def _rename_data_array(
     """
     renaming_dict = combine_dict_args(dims_dict, names)
     out = da.rename_dims(renaming_dict)
-    if out.bins is not None:
-        out.data = bins(**out.bins.constituents)
+    # The proxy refers to `out`, not its data, so it remains valid when the data is
+    # replaced below.
+    out_bins = out.bins
+    if out_bins is not None:
+        out.data = bins(**out_bins.constituents)
+    metas = [out.coords, out.deprecated_attrs]
+    if out_bins is not None:
+        metas += [out_bins.coords, out_bins.deprecated_attrs]
+    meta_names = set(out.deprecated_meta)
     for old, new in renaming_dict.items():
-        if new in out.deprecated_meta:
+        if new in meta_names:
             raise CoordError(
                 f"Cannot rename '{old}' to '{new}', since a coord or attr named {new} "
                 "already exists."
             )
-        for meta in (out.coords, out.deprecated_attrs):
-            if old in meta:
-                meta[new] = meta.pop(old)
-        if out.bins is not None:
-            for meta in (out.bins.coords, out.bins.deprecated_attrs):
-                if old in meta:
-                    meta[new] = meta.pop(old)
+        for meta in metas:
+            if (var := meta.pop(old, None)) is not None:
+                meta[new] = var
+        if old in meta_names:
+            meta_names.remove(old)
+            meta_names.add(new)
     return out
 
 
@@ -248,6 +248,20 @@ def test_from_xarray_dataset_with_only_attrs():
     assert sc_ds.sizes == {}
 
 
+@pytest.fixture(scope='module')
+def sc_da():
+    # Shared between tests, must not be modified.
+    return sc.DataArray(
+        sc.arange('aux', 0.0, 90, 2, unit='counts').fold(
+            'aux', sizes={'xx': 5, 'yy': 9}
+        ),
+        coords={
+            'xx': sc.arange('xx', 5.0, unit='s'),
+            'yy': sc.arange('yy', 9.0, unit='µK'),
+        },
+    )
+
+
 def test_to_xarray_variable():
     sc_var = sc.arange('aux', 0.0, 90, 2, unit='m').fold(
         'aux', sizes={'xx': 5, 'yy': 9}
@@ -270,16 +284,7 @@ def test_to_xarray_variable_variances_dropped():
     assert np.array_equal(xr_var.values, sc_var.values)
 
 
-def test_to_xarray_dataarray():
-    sc_da = sc.DataArray(
-        sc.arange('aux', 0.0, 90, 2, unit='counts').fold(
-            'aux', sizes={'xx': 5, 'yy': 9}
-        ),
-        coords={
-            'xx': sc.arange('xx', 5.0, unit='s'),
-            'yy': sc.arange('yy', 9.0, unit='µK'),
-        },
-    )
+def test_to_xarray_dataarray(sc_da):
     xr_da = to_xarray(sc_da)
     assert xr_da.dims == sc_da.dims
     assert xr_da.shape == sc_da.shape
@@ -378,29 +383,11 @@ def test_to_xarray_dataarray_masks_dropped():
     assert np.array_equal(xr_da.values, sc_da.values)
 
 
-def test_dataarray_round_trip():
-    sc_da = sc.DataArray(
-        sc.arange('aux', 0.0, 90, 2, unit='counts').fold(
-            'aux', sizes={'xx': 5, 'yy': 9}
-        ),
-        coords={
-            'xx': sc.arange('xx', 5.0, unit='s'),
-            'yy': sc.arange('yy', 9.0, unit='µK'),
-        },
-    )
+def test_dataarray_round_trip(sc_da):
     assert sc.identical(sc_da, from_xarray(to_xarray(sc_da)))
 
 
-def test_to_xarray_dataset():
-    sc_da = sc.DataArray(
-        sc.arange('aux', 0.0, 90, 2, unit='counts').fold(
-            'aux', sizes={'xx': 5, 'yy': 9}
-        ),
-        coords={
-            'xx': sc.arange('xx', 5.0, unit='s'),
-            'yy': sc.arange('yy', 9.0, unit='µK'),
-        },
-    )
+def test_to_xarray_dataset(sc_da):
     sc_ds = sc.Dataset({'a': sc_da, 'b': 2.0 * sc_da})
     xr_ds = to_xarray(sc_ds)
     assert all(x in xr_ds.coords for x in ["xx", "yy"])
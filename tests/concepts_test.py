@@ -39,6 +39,12 @@ def test_irreducible_mask_returns_union_of_relevant_masks():
     )
 
 
+def test_irreducible_mask_returns_None_if_there_are_no_masks():
+    da = sc.DataArray(sc.empty(dims=('xx', 'yy'), shape=(2, 3)))
+    assert concepts.irreducible_mask(da, 'xx') is None
+    assert concepts.irreducible_mask(da, None) is None
+
+
 def test_irreducible_mask_returns_None_if_all_masks_unrelated():
     da = sc.DataArray(sc.empty(dims=('xx', 'yy'), shape=(2, 3)))
     da.masks['x'] = sc.array(dims=['xx'], values=[False, True])
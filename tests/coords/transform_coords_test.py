@@ -99,6 +99,23 @@ def test_diamond_graph(a):
     assert sc.identical(da.coords['d'], expected)
 
 
+def test_diamond_graph_with_tail(a):
+    #   *a
+    #  /  \
+    # b    c
+    #  \  /
+    #    d
+    #    |
+    #   *e
+    # The dim is renamed to the end of the tail, not to the end of the diamond.
+    original = sc.DataArray(data=a, coords={'a': a})
+    graph = {('b', 'c'): split, 'd': bc, 'e': 'd'}
+    da = original.transform_coords(['e'], graph=graph)
+    assert da.dims == ('e',)
+    expected = (a * (2 * a)).rename_dims({'a': 'e'})
+    assert sc.identical(da.coords['e'], expected)
+
+
 def test_avoid_consume_of_requested_outputs(a):
     original = sc.DataArray(data=a, coords={'a': a})
     graph = {('b', 'c'): split, 'ab': ab}
@@ -679,6 +696,51 @@ def test_dataset_works_with_matching_coord(a):
     assert sc.identical(transformed.coords['b'], a.rename_dims({'a': 'b'}))
 
 
+def test_dataset_dense_items_equal_transformed_items(a):
+    da = sc.DataArray(
+        data=a.copy(),
+        coords={'a': a.copy(), 'c': a.copy()},
+        masks={'m': a > sc.scalar(1)},
+    )
+    da.coords.set_aligned('c', False)
+    ds = sc.Dataset({'item1': da.copy(), 'item2': da + da})
+    graph = {'b': 'a', 'ac': lambda a, c: a * c}
+    transformed = ds.transform_coords(['b', 'ac'], graph=graph)
+    for name in ds:
+        assert sc.identical(
+            transformed[name], ds[name].transform_coords(['b', 'ac'], graph=graph)
+        )
+
+
+def test_dataset_dense_shares_input_coords_with_output(a):
+    # Dense datasets are transformed as a whole, so like for data arrays,
+    # unconsumed input coords are writable shallow copies of the input coords.
+    ds = sc.Dataset({'item1': a.copy(), 'item2': a + a}, coords={'a': a.copy()})
+    ds.coords['c'] = a.copy()
+    transformed = ds.transform_coords('b', graph={'b': 'a'})
+    transformed.coords['c'].values[0] = -1.0
+    assert ds.coords['c'].values[0] == -1.0
+
+
+def test_dataset_without_items_transforms_coords(a):
+    ds = sc.Dataset(coords={'a': a})
+    transformed = ds.transform_coords('b', graph={'b': 'a'})
+    assert transformed.dims == ('b',)
+    assert sc.identical(transformed.coords['b'], a.rename_dims({'a': 'b'}))
+
+
+def test_dataset_binned_items_use_their_own_event_coords(binned_in_a_b):
+    other = binned_in_a_b.copy()
+    other.bins.coords['b'] *= 2.0
+    ds = sc.Dataset({'item1': binned_in_a_b, 'item2': other})
+    transformed = ds.transform_coords('b2', graph={'b2': 'b'})
+    for name, item in (('item1', binned_in_a_b), ('item2', other)):
+        assert sc.identical(
+            transformed[name].bins.coords['b2'],
+            item.bins.coords['b'].rename_dims({'b': 'b2'}),
+        )
+
+
 def test_binned_does_not_modify_inputs(binned_in_a_b):
     _ = binned_in_a_b.transform_coords(['b2'], graph={'b2': 'b'})
     assert 'b' in binned_in_a_b.coords
@@ -887,6 +949,23 @@ def test_cycles(a):
         original.transform_coords(['c'], graph={'c': 'd', 'd': bc})
 
 
+@pytest.mark.parametrize(
+    ('target', 'graph', 'cycle'),
+    [
+        ('c', {'c': 'c'}, ['c', 'c']),
+        ('c', {'c': 'd', 'd': 'c'}, ['c', 'd', 'c']),
+        ('c', {'c': 'd', 'd': 'e', 'e': 'c'}, ['c', 'e', 'd', 'c']),
+        ('f', {'f': 'e', 'e': 'd', 'd': 'e'}, ['e', 'd', 'e']),
+        ('x', {'x': 'c', 'c': 'd', 'd': bc}, ['c', 'd', 'c']),
+    ],
+)
+def test_cycle_error_reports_cycle_path(a, target, graph, cycle):
+    original = sc.DataArray(data=a, coords={'a': a, 'b': a})
+    with pytest.raises(CycleError) as err:
+        original.transform_coords([target], graph=graph)
+    assert err.value.args[1] == cycle
+
+
 def test_new_dim_in_coord(a):
     def x(a):
         return a.rename_dims({'a': 'x'})
@@ -1066,3 +1145,17 @@ def test_input_coords_can_be_defined_via_property():
     assert sc.identical(
         da.transform_coords(diff=f), da.transform_coords(diff=lambda x, y: f(x, y))
     )
+
+
+def test_logs_transform_at_info_level(caplog):
+    da = sc.data.table_xyz(nrow=10)
+    with caplog.at_level('INFO', logger='scipp'):
+        da.transform_coords(xx=lambda x: x * x)
+    assert 'Transformed coords (x) -> (xx)' in caplog.text
+
+
+def test_does_not_log_transform_above_info_level(caplog):
+    da = sc.data.table_xyz(nrow=10)
+    with caplog.at_level('WARNING', logger='scipp'):
+        da.transform_coords(xx=lambda x: x * x)
+    assert caplog.text == ''
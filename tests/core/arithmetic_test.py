@@ -1,7 +1,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 # @author Jan-Lukas Wynen
+import operator
+
 import numpy as np
+import pytest
 
 import scipp as sc
 
@@ -19,39 +22,21 @@ def make_variables():
 # e.g., __iadd__ does an in-place modification, updating `b`, but then the
 # return value is assigned to `a`, which could break the connection unless
 # the correct Python object is returned.
-def test_iadd_returns_original_object():
-    a = sc.scalar(1.2)
-    b = a
-    a += 1.0
-    assert sc.identical(a, b)
-
-
-def test_isub_returns_original_object():
-    a = sc.scalar(1.2)
-    b = a
-    a -= 1.0
-    assert sc.identical(a, b)
-
-
-def test_imul_returns_original_object():
-    a = sc.scalar(1.2)
-    b = a
-    a *= 1.0
-    assert sc.identical(a, b)
-
-
-def test_itruediv_returns_original_object():
+@pytest.mark.parametrize(
+    'op',
+    [
+        operator.iadd,
+        operator.isub,
+        operator.imul,
+        operator.itruediv,
+        operator.ifloordiv,
+    ],
+)
+def test_inplace_op_returns_original_object(op):
     a = sc.scalar(1.2)
     b = a
-    a /= 1.0
-    assert sc.identical(a, b)
-
-
-def test_ifloordiv_returns_original_object():
-    a = sc.scalar(1.2)
-    b = a
-    a //= 1.0
-    assert sc.identical(a, b)
+    a = op(a, 1.0)
+    assert a is b
 
 
 def test_add_variable():
@@ -120,10 +105,12 @@ def test_truediv_variable():
 
 def test_pow_variable():
     a, b, a_slice, b_slice, data = make_variables()
+    expected = data**data
+    expected_twice = expected**data
     c = a**b
-    assert np.array_equal(c.values, data**data)
+    assert np.array_equal(c.values, expected)
     c **= b
-    assert np.array_equal(c.values, (data**data) ** data)
+    assert np.array_equal(c.values, expected_twice)
     c = a**3
     assert np.array_equal(c.values, data**3)
     c **= 3
@@ -133,252 +120,128 @@ def test_pow_variable():
     c **= 3.0
     assert np.array_equal(c.values, (data**3.0) ** 3.0)
     c = a**b_slice
-    assert np.array_equal(c.values, data**data)
+    assert np.array_equal(c.values, expected)
     c **= b_slice
-    assert np.array_equal(c.values, (data**data) ** data)
+    assert np.array_equal(c.values, expected_twice)
     c = 2**b
     assert np.array_equal(c.values, 2**data)
     c = 2.0**b
     assert np.array_equal(c.values, 2.0**data)
 
 
-def test_iadd_variable_with_scalar():
-    v = sc.Variable(dims=['x'], values=[10.0])
-    expected = sc.Variable(dims=['x'], values=[12.0])
-    v += 2
-    assert sc.identical(v, expected)
-
-
-def test_isub_variable_with_scalar():
-    v = sc.Variable(dims=['x'], values=[10.0])
-    expected = sc.Variable(dims=['x'], values=[9.0])
-    v -= 1
-    assert sc.identical(v, expected)
-
-
-def test_imul_variable_with_scalar():
-    v = sc.Variable(dims=['x'], values=[10.0])
-    expected = sc.Variable(dims=['x'], values=[30.0])
-    v *= 3
-    assert sc.identical(v, expected)
-
-
-def test_itruediv_variable_with_scalar():
-    v = sc.Variable(dims=['x'], values=[10.0])
-    expected = sc.Variable(dims=['x'], values=[5.0])
-    v /= 2
-    assert sc.identical(v, expected)
-
-
-def test_ifloordiv_variable_with_scalar():
+@pytest.mark.parametrize(
+    ('op', 'rhs', 'expected_values'),
+    [
+        (operator.iadd, 2, [12.0, 9.0]),
+        (operator.isub, 1, [9.0, 6.0]),
+        (operator.imul, 3, [30.0, 21.0]),
+        (operator.itruediv, 2, [5.0, 3.5]),
+        (operator.ifloordiv, 2, [5.0, 3.0]),
+    ],
+)
+def test_inplace_op_variable_with_scalar(op, rhs, expected_values):
     v = sc.Variable(dims=['x'], values=[10.0, 7.0])
-    expected = sc.Variable(dims=['x'], values=[5.0, 3.0])
-    v //= 2
+    expected = sc.Variable(dims=['x'], values=expected_values)
+    v = op(v, rhs)
     assert sc.identical(v, expected)
 
 
-def test_add_dataarray_with_dataarray():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.zeros_like(da)
-    expected.data = sc.arange('x', 2.0, 20.0, 2.0)
-    assert sc.identical(da + da, expected)
-
-
-def test_sub_dataarray_with_dataarray():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.zeros_like(da)
-    assert sc.identical(da - da, expected)
-
-
-def test_mul_dataarray_with_dataarray():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.zeros_like(da)
-    expected.data = sc.arange('x', 1.0, 10.0) ** 2
-    assert sc.identical(da * da, expected)
-
-
-def test_truediv_dataarray_with_dataarray():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.ones_like(da)
-    assert sc.identical(da / da, expected)
-
-
-def test_add_dataarray_with_variable():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.zeros_like(da)
-    expected.data = sc.arange('x', 2.0, 20.0, 2.0)
-    assert sc.identical(da + da.data, expected)
-    assert sc.identical(da.data + da, expected)
-
-
-def test_sub_dataarray_with_variable():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.zeros_like(da)
-    assert sc.identical(da - da.data, expected)
-    assert sc.identical(da.data - da, expected)
-
-
-def test_mul_dataarray_with_variable():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.zeros_like(da)
-    expected.data = sc.arange('x', 1.0, 10.0) ** 2
-    assert sc.identical(da * da.data, expected)
-    assert sc.identical(da.data * da, expected)
+values = sc.arange('x', 1.0, 10.0)
+# Expected data of `op(da, da)`
+self_op_expected_data = [
+    (operator.add, sc.arange('x', 2.0, 20.0, 2.0)),
+    (operator.sub, sc.zeros(sizes={'x': 9})),
+    (operator.mul, values**2),
+    (operator.truediv, sc.ones(sizes={'x': 9})),
+]
 
 
-def test_truediv_dataarray_with_variable():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.ones_like(da)
-    assert sc.identical(da / da.data, expected)
-    assert sc.identical(da.data / da, expected)
+@pytest.fixture
+def da():
+    return sc.DataArray(values.copy(), coords={'x': sc.arange('x', 10.0, 20.0)})
 
 
-def test_add_dataarray_with_scalar():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
+@pytest.mark.parametrize(('op', 'expected_data'), self_op_expected_data)
+def test_binary_op_dataarray_with_dataarray(da, op, expected_data):
     expected = sc.zeros_like(da)
-    expected.data = sc.arange('x', 3.0, 12.0)
-    assert sc.identical(da + 2.0, expected)
-    assert sc.identical(2.0 + da, expected)
+    expected.data = expected_data
+    assert sc.identical(op(da, da), expected)
 
 
-def test_sub_dataarray_with_scalar():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
+@pytest.mark.parametrize(('op', 'expected_data'), self_op_expected_data)
+def test_binary_op_dataarray_with_variable(da, op, expected_data):
     expected = sc.zeros_like(da)
-    expected.data = sc.arange('x', 1.0, 10.0) - 2.0
-    assert sc.identical(da - 2.0, expected)
-    expected.data = 2.0 - sc.arange('x', 1.0, 10.0)
-    assert sc.identical(2.0 - da, expected)
-
-
-def test_mul_dataarray_with_scalar():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = sc.zeros_like(da)
-    expected.data = sc.arange('x', 2.0, 20.0, 2.0)
-    assert sc.identical(da * 2.0, expected)
-    assert sc.identical(2.0 * da, expected)
-
-
-def test_truediv_dataarray_with_scalar():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
+    expected.data = expected_data
+    assert sc.identical(op(da, da.data), expected)
+    assert sc.identical(op(da.data, da), expected)
+
+
+@pytest.mark.parametrize(
+    ('op', 'expected_data', 'expected_reflected_data'),
+    [
+        (operator.add, sc.arange('x', 3.0, 12.0), sc.arange('x', 3.0, 12.0)),
+        (operator.sub, values - 2.0, 2.0 - values),
+        (
+            operator.mul,
+            sc.arange('x', 2.0, 20.0, 2.0),
+            sc.arange('x', 2.0, 20.0, 2.0),
+        ),
+        (operator.truediv, values / 2.0, 2.0 / values),
+    ],
+)
+def test_binary_op_dataarray_with_scalar(
+    da, op, expected_data, expected_reflected_data
+):
     expected = sc.zeros_like(da)
-    expected.data = sc.arange('x', 1.0, 10.0) / 2.0
-    assert sc.identical(da / 2.0, expected)
-    expected.data = 2.0 / sc.arange('x', 1.0, 10.0)
-    assert sc.identical(2.0 / da, expected)
-
-
-def test_iadd_dataset_with_dataarray():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    ds = sc.Dataset({'data': da.copy()})
-    expected = sc.Dataset({'data': da + da})
-    ds += da
-    assert sc.identical(ds, expected)
-
-
-def test_isub_dataset_with_dataarray():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    ds = sc.Dataset({'data': da.copy()})
-    expected = sc.Dataset({'data': da - da})
-    ds -= da
-    assert sc.identical(ds, expected)
-
-
-def test_imul_dataset_with_dataarray():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    ds = sc.Dataset({'data': da.copy()})
-    expected = sc.Dataset({'data': da * da})
-    ds *= da
-    assert sc.identical(ds, expected)
-
-
-def test_itruediv_dataset_with_dataarray():
-    da = sc.DataArray(
-        sc.arange('x', 1.0, 10.0), coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
+    expected.data = expected_data
+    assert sc.identical(op(da, 2.0), expected)
+    expected.data = expected_reflected_data
+    assert sc.identical(op(2.0, da), expected)
+
+
+@pytest.mark.parametrize(
+    ('iop', 'expected_data'),
+    [
+        (operator.iadd, sc.arange('x', 2.0, 20.0, 2.0)),
+        (operator.isub, sc.zeros(sizes={'x': 9})),
+        (operator.imul, values**2),
+        (operator.itruediv, sc.ones(sizes={'x': 9})),
+    ],
+)
+def test_inplace_op_dataset_with_dataarray(da, iop, expected_data):
     ds = sc.Dataset({'data': da.copy()})
-    expected = sc.Dataset({'data': da / da})
-    ds /= da
-    assert sc.identical(ds, expected)
-
-
-def test_iadd_dataset_with_scalar():
-    ds = sc.Dataset(
-        data={'data': sc.arange('x', 10.0)}, coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = ds.copy()
-    expected['data'] = ds['data'] + 2.0
-
-    ds += 2.0
-    assert sc.identical(ds, expected)
-
-
-def test_isub_dataset_with_scalar():
-    ds = sc.Dataset(
-        data={'data': sc.arange('x', 10.0)}, coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
-    expected = ds.copy()
-    expected['data'] = ds['data'] - 3.0
-
-    ds -= 3.0
+    expected = sc.zeros_like(da)
+    expected.data = expected_data
+    expected = sc.Dataset({'data': expected})
+    ds = iop(ds, da)
     assert sc.identical(ds, expected)
 
 
-def test_imul_dataset_with_scalar():
-    ds = sc.Dataset(
+@pytest.fixture
+def ds():
+    return sc.Dataset(
         data={'data': sc.arange('x', 10.0)}, coords={'x': sc.arange('x', 10.0, 20.0)}
     )
-    expected = ds.copy()
-    expected['data'] = ds['data'] * 1.5
-
-    ds *= 1.5
-    assert sc.identical(ds, expected)
 
 
-def test_itruediv_dataset_with_scalar():
-    ds = sc.Dataset(
-        data={'data': sc.arange('x', 10.0)}, coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
+@pytest.mark.parametrize(
+    ('iop', 'op', 'rhs'),
+    [
+        (operator.iadd, operator.add, 2.0),
+        (operator.isub, operator.sub, 3.0),
+        (operator.imul, operator.mul, 1.5),
+        (operator.itruediv, operator.truediv, 0.5),
+    ],
+)
+def test_inplace_op_dataset_with_scalar(ds, iop, op, rhs):
     expected = ds.copy()
-    expected['data'] = ds['data'] / 0.5
+    expected['data'] = op(ds['data'], rhs)
 
-    ds /= 0.5
+    ds = iop(ds, rhs)
     assert sc.identical(ds, expected)
 
 
-def test_isub_dataset_with_dataset_broadcast():
-    ds = sc.Dataset(
-        data={'data': sc.arange('x', 10.0)}, coords={'x': sc.arange('x', 10.0, 20.0)}
-    )
+def test_isub_dataset_with_dataset_broadcast(ds):
     expected = ds - ds['x', 0]
     ds -= ds['x', 0]
     assert sc.identical(ds, expected)
@@ -1,7 +1,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 # @author Jan-Lukas Wynen
+import operator
+
 import numpy as np
+import pytest
 
 import scipp as sc
 
@@ -11,82 +14,60 @@ def test_logical_not_variable():
     assert sc.identical(~sc.scalar(True), sc.scalar(False))
 
 
-def test_logical_ior_variable_with_variable():
-    a = sc.scalar(False)
-    b = sc.scalar(True)
-    a |= b
-    assert sc.identical(a, sc.scalar(True))
-
-    a = sc.Variable(dims=['x'], values=np.array([False, True, False, True]))
-    b = sc.Variable(dims=['x'], values=np.array([False, False, True, True]))
-    a |= b
-    assert sc.identical(
-        a, sc.Variable(dims=['x'], values=np.array([False, True, True, True]))
-    )
-
-
-def test_logical_or_variable_with_variable():
-    a = sc.scalar(False)
-    b = sc.scalar(True)
-    assert sc.identical((a | b), sc.scalar(True))
-
-    a = sc.Variable(dims=['x'], values=np.array([False, True, False, True]))
-    b = sc.Variable(dims=['x'], values=np.array([False, False, True, True]))
-    assert sc.identical(
-        (a | b), sc.Variable(dims=['x'], values=np.array([False, True, True, True]))
-    )
-
-
-def test_logical_iand_variable_with_variable():
-    a = sc.scalar(False)
-    b = sc.scalar(True)
-    a &= b
-    assert sc.identical(a, sc.scalar(False))
-
-    a = sc.Variable(dims=['x'], values=np.array([False, True, False, True]))
-    b = sc.Variable(dims=['x'], values=np.array([False, False, True, True]))
-    a &= b
-    assert sc.identical(
-        a, sc.Variable(dims=['x'], values=np.array([False, False, False, True]))
-    )
+# Covers all four combinations of operands. The Variable constructor copies
+# the values, so in-place tests do not modify these arrays.
+a_values = np.array([False, True, False, True])
+b_values = np.array([False, False, True, True])
 
 
-def test_logical_and_variable_with_variable():
+@pytest.mark.parametrize(
+    ('op', 'expected_scalar', 'expected_values'),
+    [
+        (operator.or_, True, [False, True, True, True]),
+        (operator.and_, False, [False, False, False, True]),
+        (operator.xor, True, [False, True, True, False]),
+    ],
+)
+def test_logical_binary_op_variable_with_variable(op, expected_scalar, expected_values):
     a = sc.scalar(False)
     b = sc.scalar(True)
-    assert sc.identical((a & b), sc.scalar(False))
+    assert sc.identical(op(a, b), sc.scalar(expected_scalar))
 
-    a = sc.Variable(dims=['x'], values=np.array([False, True, False, True]))
-    b = sc.Variable(dims=['x'], values=np.array([False, False, True, True]))
+    a = sc.Variable(dims=['x'], values=a_values)
+    b = sc.Variable(dims=['x'], values=b_values)
     assert sc.identical(
-        (a & b), sc.Variable(dims=['x'], values=np.array([False, False, False, True]))
+        op(a, b), sc.Variable(dims=['x'], values=np.array(expected_values))
     )
 
 
-def test_logical_ixor_variable_with_variable():
+@pytest.mark.parametrize(
+    ('op', 'expected_scalar', 'expected_values'),
+    [
+        (operator.ior, True, [False, True, True, True]),
+        (operator.iand, False, [False, False, False, True]),
+        (operator.ixor, True, [False, True, True, False]),
+    ],
+)
+def test_logical_inplace_op_variable_with_variable(
+    op, expected_scalar, expected_values
+):
     a = sc.scalar(False)
     b = sc.scalar(True)
-    a ^= b
-    assert sc.identical(a, sc.scalar(True))
+    a = op(a, b)
+    assert sc.identical(a, sc.scalar(expected_scalar))
 
-    a = sc.Variable(dims=['x'], values=np.array([False, True, False, True]))
-    b = sc.Variable(dims=['x'], values=np.array([False, False, True, True]))
-    a ^= b
-    assert sc.identical(
-        a, sc.Variable(dims=['x'], values=np.array([False, True, True, False]))
-    )
+    a = sc.Variable(dims=['x'], values=a_values)
+    b = sc.Variable(dims=['x'], values=b_values)
+    a = op(a, b)
+    assert sc.identical(a, sc.Variable(dims=['x'], values=np.array(expected_values)))
 
 
-def test_logical_xor_variable_with_variable():
+@pytest.mark.parametrize('op', [operator.ior, operator.iand, operator.ixor])
+def test_logical_inplace_op_returns_original_object(op):
     a = sc.scalar(False)
-    b = sc.scalar(True)
-    assert sc.identical((a ^ b), sc.scalar(True))
-
-    a = sc.Variable(dims=['x'], values=np.array([False, True, False, True]))
-    b = sc.Variable(dims=['x'], values=np.array([False, False, True, True]))
-    assert sc.identical(
-        (a ^ b), sc.Variable(dims=['x'], values=np.array([False, True, True, False]))
-    )
+    b = a
+    a = op(a, sc.scalar(True))
+    assert a is b
 
 
 def test_logical_not_function():
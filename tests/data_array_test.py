@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 
 import scipp as sc
+from scipp.core import irreducible_mask
 
 
 def make_dataarray(dim1='x', dim2='y', seed=None):
@@ -177,6 +178,19 @@ def test_masks_delitem():
     assert sc.identical(da, ref)
 
 
+def test_irreducible_mask_returns_None_if_there_are_no_masks():
+    da = make_dataarray()
+    assert irreducible_mask(da.masks, 'x') is None
+
+
+def test_irreducible_mask_returns_mask_depending_on_dim():
+    da = make_dataarray()
+    mask = sc.Variable(dims=['x'], values=np.array([False, True], dtype=bool))
+    da.masks['mask1'] = mask
+    assert sc.identical(irreducible_mask(da.masks, 'x'), mask)
+    assert irreducible_mask(da.masks, 'y') is None
+
+
 def test_ipython_key_completion():
     da = make_dataarray()
     mask = sc.Variable(dims=['x'], values=np.array([False, True], dtype=bool))
@@ -21,6 +21,15 @@ def test_numpy_self_assign_1d_flip():
     assert sc.identical(var, expected)
 
 
+def test_numpy_self_assign_1d_flip_exceeding_grainsize():
+    # Large enough to be copied in multiple parallel chunks, which would race
+    # if the overlapping source was not copied to a temporary first.
+    var = sc.Variable(dims=['x'], values=np.arange(100_000))
+    expected = sc.Variable(dims=['x'], values=np.flip(var.values))
+    var.values = np.flip(var.values)
+    assert sc.identical(var, expected)
+
+
 def test_numpy_self_assign_2d_flip_both():
     var = sc.Variable(dims=['y', 'x'], values=np.arange(100).reshape(10, 10))
     expected = sc.Variable(dims=['y', 'x'], values=np.flip(var.values))
@@ -64,189 +64,127 @@ def data_array_and_components(coords_arg_wrapper, attrs_arg_wrapper, masks_arg_w
     return da, v, c, a, m
 
 
+# Result of mutate_through_views.
+mutated = sc.DataArray(
+    sc.array(dims=['x'], values=[-10, -20], unit='kg'),
+    coords={'x': sc.array(dims=['x'], values=[-1, -2], unit='J')},
+    attrs={'a': sc.array(dims=['x'], values=[-100, -200])},
+    masks={'m': sc.array(dims=['x'], values=[False, True])},
+)
+# Result of assigning new data and metadata after mutate_through_views.
+reassigned = sc.DataArray(
+    sc.array(dims=['x'], values=[11, 22], unit='m'),
+    coords={'x': sc.array(dims=['x'], values=[3, 4], unit='s')},
+    attrs={'a': sc.array(dims=['x'], values=[300, 400])},
+    masks={'m': sc.array(dims=['x'], values=[True, True])},
+)
+# Result of mutating a data array both directly and through a dataset.
+mutated_through_dataset = sc.DataArray(
+    sc.array(dims=['x'], values=[-10, -20], unit='kg'),
+    coords={'x': sc.array(dims=['x'], values=[1, -2], unit='s')},
+    attrs={'a': sc.array(dims=['x'], values=[-100, -200])},
+    masks={'m': sc.array(dims=['x'], values=[False, True])},
+)
+
+
 def make_data_array():
     v, c, a, m = data_array_components()
     da = sc.DataArray(v, coords={'x': c}, attrs={'a': a}, masks={'m': m})
     return da, v, c, a, m
 
 
-def test_own_darr_set(data_array_and_components):
-    # Data and metadata are shared
-    da, v, c, a, m = data_array_and_components
-    da['x', 0] = -10
-    da.data['x', 1] = -20
-    da.coords['x']['x', 0] = -1
-    da.attrs['a']['x', 0] = -100
-    da.masks['m']['x', 0] = False
-    c['x', 1] = -2
-    a['x', 1] = -200
-    m['x', 1] = True
-    da.unit = 'kg'
-    da.coords['x'].unit = 'J'
-    assert sc.identical(
-        da,
-        sc.DataArray(
-            sc.array(dims=['x'], values=[-10, -20], unit='kg'),
-            coords={'x': sc.array(dims=['x'], values=[-1, -2], unit='J')},
-            attrs={'a': sc.array(dims=['x'], values=[-100, -200])},
-            masks={'m': sc.array(dims=['x'], values=[False, True])},
-        ),
-    )
-    assert sc.identical(v, sc.array(dims=['x'], values=[-10, -20], unit='kg'))
-    assert sc.identical(c, sc.array(dims=['x'], values=[-1, -2], unit='J'))
-    assert sc.identical(a, sc.array(dims=['x'], values=[-100, -200]))
-    assert sc.identical(m, sc.array(dims=['x'], values=[False, True]))
+@pytest.fixture(scope='session')
+def pristine_data_array():
+    return make_data_array()[0]
 
-    # Assignments overwrite data but not metadata.
-    da.data = sc.array(dims=['x'], values=[11, 22], unit='m')
-    da.coords['x'] = sc.array(dims=['x'], values=[3, 4], unit='s')
-    da.attrs['a'] = sc.array(dims=['x'], values=[300, 400])
-    da.masks['m'] = sc.array(dims=['x'], values=[True, True])
-    assert sc.identical(
-        da,
-        sc.DataArray(
-            sc.array(dims=['x'], values=[11, 22], unit='m'),
-            coords={'x': sc.array(dims=['x'], values=[3, 4], unit='s')},
-            attrs={'a': sc.array(dims=['x'], values=[300, 400])},
-            masks={'m': sc.array(dims=['x'], values=[True, True])},
-        ),
-    )
-    # Assignment replaces data
-    assert not sc.identical(v, sc.array(dims=['x'], values=[11, 22], unit='m'))
-    assert sc.identical(da.data, sc.array(dims=['x'], values=[11, 22], unit='m'))
-    assert sc.identical(c, sc.array(dims=['x'], values=[-1, -2], unit='J'))
-    assert sc.identical(a, sc.array(dims=['x'], values=[-100, -200]))
-    assert sc.identical(m, sc.array(dims=['x'], values=[False, True]))
+
+@pytest.fixture
+def data_array(pristine_data_array):
+    return pristine_data_array.copy()
 
 
-def test_own_darr_get():
-    # Data and metadata are shared.
-    da = make_data_array()[0]
-    v = da.data
-    c = da.coords['x']
-    a = da.attrs['a']
-    m = da.masks['m']
+@pytest.fixture
+def dset_with_da1(data_array):
+    return sc.Dataset({'da1': data_array}), data_array
+
+
+def mutate_through_views(da, c, a, m=None):
+    coord = da.coords['x']
     da['x', 0] = -10
     da.data['x', 1] = -20
-    da.coords['x']['x', 0] = -1
+    coord['x', 0] = -1
     da.attrs['a']['x', 0] = -100
-    da.masks['m']['x', 0] = False
+    if m is not None:
+        da.masks['m']['x', 0] = False
     c['x', 1] = -2
     a['x', 1] = -200
-    m['x', 1] = True
+    if m is not None:
+        m['x', 1] = True
     da.unit = 'kg'
-    da.coords['x'].unit = 'J'
-    assert sc.identical(
-        da,
-        sc.DataArray(
-            sc.array(dims=['x'], values=[-10, -20], unit='kg'),
-            coords={'x': sc.array(dims=['x'], values=[-1, -2], unit='J')},
-            attrs={'a': sc.array(dims=['x'], values=[-100, -200])},
-            masks={'m': sc.array(dims=['x'], values=[False, True])},
-        ),
-    )
-    assert sc.identical(v, sc.array(dims=['x'], values=[-10, -20], unit='kg'))
-    assert sc.identical(c, sc.array(dims=['x'], values=[-1, -2], unit='J'))
-    assert sc.identical(a, sc.array(dims=['x'], values=[-100, -200]))
-    assert sc.identical(m, sc.array(dims=['x'], values=[False, True]))
+    coord.unit = 'J'
 
-    # Assignments overwrite data but not coords.
-    da.data = sc.array(dims=['x'], values=[11, 22], unit='m')
-    da.coords['x'] = sc.array(dims=['x'], values=[3, 4], unit='s')
-    da.attrs['a'] = sc.array(dims=['x'], values=[300, 400])
-    da.masks['m'] = sc.array(dims=['x'], values=[True, True])
-    assert sc.identical(
-        da,
-        sc.DataArray(
-            sc.array(dims=['x'], values=[11, 22], unit='m'),
-            coords={'x': sc.array(dims=['x'], values=[3, 4], unit='s')},
-            attrs={'a': sc.array(dims=['x'], values=[300, 400])},
-            masks={'m': sc.array(dims=['x'], values=[True, True])},
-        ),
-    )
-    # Assignment replaces data
-    assert not sc.identical(v, sc.array(dims=['x'], values=[11, 22], unit='m'))
-    assert sc.identical(da.data, sc.array(dims=['x'], values=[11, 22], unit='m'))
-    assert sc.identical(c, sc.array(dims=['x'], values=[-1, -2], unit='J'))
-    assert sc.identical(a, sc.array(dims=['x'], values=[-100, -200]))
-    assert sc.identical(m, sc.array(dims=['x'], values=[False, True]))
 
+def check_views_are_shared(da, v, c, a, m=None):
+    """Check that mutations and assignments through `da` and the views interact.
 
-def test_own_darr_get_meta():
+    `m` may be None if the data array has no mask.
+    """
     # Data and metadata are shared.
-    da = make_data_array()[0]
-    del da.masks['m']  # not accessible through .meta and tested elsewhere
-    v = da.data
-    c = da.meta['x']
-    a = da.meta['a']
-    da['x', 0] = -10
-    da.data['x', 1] = -20
-    da.coords['x']['x', 0] = -1
-    da.attrs['a']['x', 0] = -100
-    c['x', 1] = -2
-    a['x', 1] = -200
-    da.unit = 'kg'
-    da.coords['x'].unit = 'J'
-    assert sc.identical(
-        da,
-        sc.DataArray(
-            sc.array(dims=['x'], values=[-10, -20], unit='kg'),
-            coords={'x': sc.array(dims=['x'], values=[-1, -2], unit='J')},
-            attrs={'a': sc.array(dims=['x'], values=[-100, -200])},
-        ),
-    )
-    assert sc.identical(v, sc.array(dims=['x'], values=[-10, -20], unit='kg'))
-    assert sc.identical(c, sc.array(dims=['x'], values=[-1, -2], unit='J'))
-    assert sc.identical(a, sc.array(dims=['x'], values=[-100, -200]))
+    mutate_through_views(da, c, a, m)
+    assert sc.identical(da, mutated if m is not None else mutated.drop_masks('m'))
+    assert sc.identical(v, mutated.data)
+    assert sc.identical(c, mutated.coords['x'])
+    assert sc.identical(a, mutated.attrs['a'])
+    if m is not None:
+        assert sc.identical(m, mutated.masks['m'])
 
-    # Assignments overwrite data but not coords.
+    # Assignments overwrite data but not metadata.
     da.data = sc.array(dims=['x'], values=[11, 22], unit='m')
     da.coords['x'] = sc.array(dims=['x'], values=[3, 4], unit='s')
     da.attrs['a'] = sc.array(dims=['x'], values=[300, 400])
-    assert sc.identical(
-        da,
-        sc.DataArray(
-            sc.array(dims=['x'], values=[11, 22], unit='m'),
-            coords={'x': sc.array(dims=['x'], values=[3, 4], unit='s')},
-            attrs={'a': sc.array(dims=['x'], values=[300, 400])},
-        ),
-    )
+    if m is not None:
+        da.masks['m'] = sc.array(dims=['x'], values=[True, True])
+    assert sc.identical(da, reassigned if m is not None else reassigned.drop_masks('m'))
     # Assignment replaces data
-    assert not sc.identical(v, sc.array(dims=['x'], values=[11, 22], unit='m'))
-    assert sc.identical(da.data, sc.array(dims=['x'], values=[11, 22], unit='m'))
-    assert sc.identical(c, sc.array(dims=['x'], values=[-1, -2], unit='J'))
-    assert sc.identical(a, sc.array(dims=['x'], values=[-100, -200]))
+    assert not sc.identical(v, reassigned.data)
+    assert sc.identical(da.data, reassigned.data)
+    assert sc.identical(c, mutated.coords['x'])
+    assert sc.identical(a, mutated.attrs['a'])
+    if m is not None:
+        assert sc.identical(m, mutated.masks['m'])
 
 
-def test_own_darr_copy():
+def get_views(da, accessor):
+    if accessor == 'meta':
+        # Masks are not accessible through .meta and tested elsewhere.
+        del da.masks['m']
+        return da.data, da.meta['x'], da.meta['a'], None
+    return da.data, da.coords['x'], da.attrs['a'], da.masks['m']
+
+
+def test_own_darr_set(data_array_and_components):
+    check_views_are_shared(*data_array_and_components)
+
+
+@pytest.mark.parametrize('accessor', ['coords', 'meta'])
+def test_own_darr_get(data_array, accessor):
+    check_views_are_shared(data_array, *get_views(data_array, accessor))
+
+
+def test_own_darr_copy(pristine_data_array):
     # Depth of copy can be controlled.
     da, _, c, a, m = make_data_array()
     da_copy = copy(da)
     da_deepcopy = deepcopy(da)
     da_methcopy = da.copy(deep=False)
     da_methdeepcopy = da.copy(deep=True)
-    da['x', 0] = -10
-    da.data['x', 1] = -20
-    da.coords['x']['x', 0] = -1
-    da.attrs['a']['x', 0] = -100
-    da.masks['m']['x', 0] = False
-    c['x', 1] = -2
-    a['x', 1] = -200
-    m['x', 1] = True
-    da.unit = 'kg'
-    da.coords['x'].unit = 'J'
+    mutate_through_views(da, c, a, m)
 
-    modified = sc.DataArray(
-        sc.array(dims=['x'], values=[-10, -20], unit='kg'),
-        coords={'x': sc.array(dims=['x'], values=[-1, -2], unit='J')},
-        attrs={'a': sc.array(dims=['x'], values=[-100, -200])},
-        masks={'m': sc.array(dims=['x'], values=[False, True])},
-    )
-    assert sc.identical(da, modified)
-    assert sc.identical(da_copy, modified)
-    assert sc.identical(da_deepcopy, make_data_array()[0])
-    assert sc.identical(da_methcopy, modified)
-    assert sc.identical(da_methdeepcopy, make_data_array()[0])
+    assert sc.identical(da, mutated)
+    assert sc.identical(da_copy, mutated)
+    assert sc.identical(da_deepcopy, pristine_data_array)
+    assert sc.identical(da_methcopy, mutated)
+    assert sc.identical(da_methdeepcopy, pristine_data_array)
 
 
 @pytest.mark.parametrize(
@@ -254,65 +192,54 @@ def test_own_darr_copy():
     [lambda k, v: {k: v}, lambda k, v: {k: v}.items(), lambda k, v: sc.Dataset({k: v})],
     ids=['dict', 'iterator', 'Dataset'],
 )
-def test_own_dset_init(data_array_wrapper):
-    da, *_ = make_data_array()
+def test_own_dset_init(data_array_wrapper, data_array):
+    da = data_array
     dset = sc.Dataset(data_array_wrapper('da1', da))
 
-    dset['da1']['x', 0] = -10
-    dset['da1'].attrs['a']['x', 0] = -100
-    dset['da1'].masks['m']['x', 0] = False
+    item = dset['da1']
+    item['x', 0] = -10
+    item.attrs['a']['x', 0] = -100
+    item.masks['m']['x', 0] = False
     da['x', 1] = -20
     da.coords['x']['x', 1] = -2
     da.attrs['a']['x', 1] = -200
     da.masks['m']['x', 1] = True
-    dset['da1'].unit = 'kg'
+    item.unit = 'kg'
 
-    expected = sc.DataArray(
-        sc.array(dims=['x'], values=[-10, -20], unit='kg'),
-        coords={'x': sc.array(dims=['x'], values=[1, -2], unit='s')},
-        attrs={'a': sc.array(dims=['x'], values=[-100, -200])},
-        masks={'m': sc.array(dims=['x'], values=[False, True])},
-    )
-    assert sc.identical(dset, sc.Dataset(data={'da1': expected}))
-    assert sc.identical(da, expected)
+    assert sc.identical(dset, sc.Dataset(data={'da1': mutated_through_dataset}))
+    assert sc.identical(da, mutated_through_dataset)
 
 
-def test_own_dset_set_access_through_dataarray():
+def test_own_dset_set_access_through_dataarray(dset_with_da1):
     # The DataArray is shared.
-    da, *_ = make_data_array()
-    dset = sc.Dataset({'da1': da})
+    dset, da = dset_with_da1
 
-    dset['da1']['x', 0] = -10
-    dset['da1'].attrs['a']['x', 0] = -100
-    dset['da1'].masks['m']['x', 0] = False
+    item = dset['da1']
+    item['x', 0] = -10
+    item.attrs['a']['x', 0] = -100
+    item.masks['m']['x', 0] = False
     da['x', 1] = -20
     da.coords['x']['x', 1] = -2
     da.attrs['a']['x', 1] = -200
     da.masks['m']['x', 1] = True
-    dset['da1'].unit = 'kg'
+    item.unit = 'kg'
 
-    expected = sc.DataArray(
-        sc.array(dims=['x'], values=[-10, -20], unit='kg'),
-        coords={'x': sc.array(dims=['x'], values=[1, -2], unit='s')},
-        attrs={'a': sc.array(dims=['x'], values=[-100, -200])},
-        masks={'m': sc.array(dims=['x'], values=[False, True])},
-    )
-    assert sc.identical(dset, sc.Dataset(data={'da1': expected}))
-    assert sc.identical(da, expected)
+    assert sc.identical(dset, sc.Dataset(data={'da1': mutated_through_dataset}))
+    assert sc.identical(da, mutated_through_dataset)
 
 
-def test_own_dset_set_access_through_scalar_slice():
+def test_own_dset_set_access_through_scalar_slice(dset_with_da1):
     # The DataArray is shared.
-    da, *_ = make_data_array()
-    dset = sc.Dataset({'da1': da})
+    dset, da = dset_with_da1
 
-    dset['x', 0]['da1'].value = -10
-    dset['x', 0]['da1'].attrs['a'].value = -100
-    dset['x', 0]['da1'].masks['m'].value = False
+    item = dset['x', 0]['da1']
+    item.value = -10
+    item.attrs['a'].value = -100
+    item.masks['m'].value = False
     with pytest.raises(sc.VariableError):
-        dset['x', 0]['da1'].coords['x'].value = -1
+        item.coords['x'].value = -1
     with pytest.raises(sc.UnitError):
-        dset['x', 0]['da1'].unit = 's'
+        item.unit = 's'
 
     expected = sc.DataArray(
         sc.array(dims=['x'], values=[-10, 20], unit='m'),
@@ -324,15 +251,15 @@ def test_own_dset_set_access_through_scalar_slice():
     assert sc.identical(da, expected)
 
 
-def test_own_dset_set_access_through_range_slice():
+def test_own_dset_set_access_through_range_slice(dset_with_da1):
     # The DataArray is shared.
-    da, *_ = make_data_array()
-    dset = sc.Dataset({'da1': da})
+    dset, da = dset_with_da1
 
-    dset['x', :]['da1']['x', 0] = -10
-    dset['x', :]['da1'].attrs['a']['x', 0] = -100
-    dset['x', :]['da1'].masks['m']['x', False] = False
-    dset['x', :]['da1'].unit = 'kg'
+    item = dset['x', :]['da1']
+    item['x', 0] = -10
+    item.attrs['a']['x', 0] = -100
+    item.masks['m']['x', False] = False
+    item.unit = 'kg'
 
     expected = sc.DataArray(
         sc.array(dims=['x'], values=[-10, 20], unit='kg'),
@@ -344,26 +271,26 @@ def test_own_dset_set_access_through_range_slice():
     assert sc.identical(da, expected)
 
 
-def test_own_dset_set_access_through_coords():
+def test_own_dset_set_access_through_coords(dset_with_da1, pristine_data_array):
     # The DataArray is shared.
-    da, *_ = make_data_array()
-    dset = sc.Dataset({'da1': da})
+    dset, da = dset_with_da1
     dset.coords['x']['x', 0] = -1
 
-    expected, *_ = make_data_array()
+    expected = pristine_data_array.copy()
     expected.coords['x']['x', 0] = -1
     assert sc.identical(dset, sc.Dataset(data={'da1': expected}))
     assert sc.identical(da, expected)
 
 
-def test_own_dset_set_access_through_range_slice_coords():
+def test_own_dset_set_access_through_range_slice_coords(
+    dset_with_da1, pristine_data_array
+):
     # The DataArray is shared.
-    da, *_ = make_data_array()
-    dset = sc.Dataset({'da1': da})
+    dset, da = dset_with_da1
     dset['x', :]['da1']['x', 0] = -10
     dset['x', :].coords['x']['x', 0] = -1
 
-    expected, *_ = make_data_array()
+    expected = pristine_data_array.copy()
     expected['x', 0] = -10
     expected.coords['x']['x', 0] = -1
     assert sc.identical(dset, sc.Dataset(data={'da1': expected}))
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 # @author Simon Heybrock
+from types import MappingProxyType
+
 import pytest
 
 import scipp as sc
@@ -49,6 +51,12 @@ def test_rename_kwargs():
     assert sc.identical(renamed, make_dataarray('y', 'x'))
 
 
+def test_rename_accepts_non_dict_mapping():
+    da = make_dataarray('x', 'y')
+    renamed = da.rename(MappingProxyType({'y': 'z'}))
+    assert sc.identical(renamed, make_dataarray('x', 'z'))
+
+
 def test_rename_with_attr():
     da = make_dataarray('x', 'y')
     da.attrs['y'] = da.coords.pop('y')
@@ -108,6 +116,14 @@ def test_rename_of_bins_coords_and_attrs_does_not_affect_input():
     assert 'y' in da.bins.attrs
 
 
+def test_rename_output_bins_coords_are_independent_of_input():
+    # Dim 'p' is not a bins coord, so only the dim is renamed.
+    da = sc.data.table_xyz(10).bin(x=4).rename_dims(x='p')
+    renamed = da.rename(p='q')
+    renamed.bins.coords['new'] = renamed.bins.coords['y']
+    assert 'new' not in da.bins.coords
+
+
 def test_rename_raises_DimensionError_if_only_bins_coords_or_attrs():
     table = sc.data.table_xyz(10)
     table.attrs['z'] = table.coords.pop('z')
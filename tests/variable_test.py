@@ -3,6 +3,7 @@
 # @file
 # @author Simon Heybrock
 import os
+from types import MappingProxyType
 
 import numpy as np
 import pytest
@@ -436,6 +437,13 @@ def test_rename_dims_kwargs():
     assert sc.identical(xy, original)
 
 
+def test_rename_dims_accepts_non_dict_mapping():
+    values = np.arange(6).reshape(2, 3)
+    xy = sc.Variable(dims=['x', 'y'], values=values)
+    zy = sc.Variable(dims=['z', 'y'], values=values)
+    assert sc.identical(xy.rename_dims(MappingProxyType({'x': 'z'})), zy)
+
+
 def test_rename_dims_dict_and_kwargs_must_be_distinct():
     values = np.arange(6).reshape(2, 3)
     xy = sc.Variable(dims=['x', 'y'], values=values)